@@ -3,6 +3,7 @@ Provides a set of utilities aimed at app developpers
 """
 from datetime import datetime
 import logging
+import threading
 from functools import wraps
 from queue import Queue
 from time import time
@@ -27,14 +28,24 @@ def log(func):
 
     Logs are issued using is the logger named after the decorated function's enclosing module.
 
+    When DEBUG logging is disabled for that module, the decorated function is called straight away :
+    no argument stringification, no timing, no logging machinery. This matters on functions called
+    once per frame or per Qt signal.
+
     :param func: The function to decorate
     :return: The decorated function
     """
 
+    # resolved once at decoration time, not on every call
+    logger = logging.getLogger(func.__module__)
+    function_name = func.__qualname__
+
     @wraps(func)
     def wrapped(*args, **kwargs):
-        function_name = func.__qualname__
-        logger = logging.getLogger(func.__module__)
+
+        if not logger.isEnabledFor(logging.DEBUG):
+            return func(*args, **kwargs)
+
         logger.debug(f"{function_name}() called with : {str(args)} - {str(kwargs)}")
         start_time = time()
         result = func(*args, **kwargs)
@@ -88,6 +99,11 @@ class AlsException(Exception):
         self.details = details
 
 
+# size change signals of a SignalingQueue are batched : changes occurring less than this long
+# after the first pending one travel in the same signal emission
+_SIZE_SIGNAL_BATCH_WINDOW_IN_SEC = 0.005
+
+
 class SignalingQueue(Queue, QObject):
     """
     Queue subclass that emits a Qt signal when items are added or removed from the queue.
@@ -97,6 +113,10 @@ class SignalingQueue(Queue, QObject):
       - size_changed_signal
 
     and carries the new queue size
+
+    Emission is coalesced : size changes arriving within a short window are signaled once, with
+    the queue size read at emission time. A burst of puts and gets then costs listeners a single
+    cross-thread Qt dispatch instead of one per operation.
     """
 
     size_changed_signal = pyqtSignal(int)
@@ -111,29 +131,69 @@ class SignalingQueue(Queue, QObject):
     def __init__(self, maxsize=0):
         Queue.__init__(self, maxsize)
         QObject.__init__(self)
+        self._size_emission_lock = threading.Lock()
+        self._size_emission_timer = None
 
     @log
     def get(self, block=True, timeout=None):
         item = super().get(block, timeout)
-        self.size_changed_signal.emit(self.qsize())
+        self._schedule_size_emission()
         return item
 
     @log
     def get_nowait(self):
         item = super().get_nowait()
-        self.size_changed_signal.emit(self.qsize())
+        self._schedule_size_emission()
         return item
 
     @log
     def put(self, item, block=True, timeout=None):
         super().put(item, block, timeout)
-        self.size_changed_signal.emit(self.qsize())
+        self._schedule_size_emission()
 
     @log
     def put_nowait(self, item):
         super().put_nowait(item)
+        self._schedule_size_emission()
+
+    def _schedule_size_emission(self):
+        """
+        Arms the batching timer if no emission is already pending.
+
+        A plain threading.Timer is used on purpose : queues are operated from worker threads
+        that run no Qt event loop, so a QTimer could never fire there.
+        """
+        with self._size_emission_lock:
+            if self._size_emission_timer is None:
+                self._size_emission_timer = threading.Timer(_SIZE_SIGNAL_BATCH_WINDOW_IN_SEC, self._emit_size)
+                self._size_emission_timer.daemon = True
+                self._size_emission_timer.start()
+
+    def _emit_size(self):
+        """
+        Emits the size change coalesced over the batching window
+        """
+        with self._size_emission_lock:
+            self._size_emission_timer = None
+
         self.size_changed_signal.emit(self.qsize())
 
+    @log
+    def clear(self):
+        """
+        Discards all queued items at once.
+
+        This is a single O(1) operation under the queue's lock, where draining with repeated
+        get() calls costs a lock round-trip and a signal emission per item. The size change is
+        signaled once, after the queue is empty.
+        """
+        with self.mutex:
+            self.queue.clear()
+            self.unfinished_tasks = 0
+            self.not_full.notify_all()
+
+        self._schedule_size_emission()
+
 
 @log
 def get_timestamp():
@@ -147,6 +207,19 @@ def get_timestamp():
     return timestamp
 
 
+@log
+def get_timestamp_for_filename():
+    """
+    Return a filename-safe timestamp built from current date and time
+
+    Formatting is a single strftime call : no intermediate strings to scan or mutate
+
+    :return: the timestamp, safe for use in a file name
+    :rtype: str
+    """
+    return datetime.now().strftime('%Y-%m-%d-%H-%M-%S-%f')
+
+
 @log
 def human_readable_byte_size(num):
     """
@@ -182,6 +255,25 @@ def get_text_content_of_resource(resource_uri: str):
         return ""
 
 
+@log
+def get_binary_content_of_resource(resource_uri: str):
+    """
+    Get binary content of a file stored inside Qt resources
+
+    :param resource_uri: URI if said resource
+    :type resource_uri: str
+
+    :return: binary content or empty bytes if an OS error occurred
+    :rtype: bytes
+    """
+    try:
+        fake_file = QFile(resource_uri)
+        fake_file.open(QIODevice.ReadOnly)
+        return bytes(fake_file.readAll())
+    except OSError:
+        return b""
+
+
 @log
 def available_memory():
     return psutil.virtual_memory().available
@@ -46,6 +46,9 @@ _LANG = "lang"
 _BAYER_PATTERN = "bayer_pattern"
 _NIGHT_MODE = "night_mode"
 _SAVE_ON_STOP = "save_on_stop"
+_SCAN_POLLING_PERIOD = "scan_polling_period"
+_POST_PROCESS_FRAME_INTERVAL = "post_process_frame_interval"
+_USE_SAVER_PROCESS_POOL = "use_saver_process_pool"
 
 # keys used to describe logging level
 _LOG_LEVEL_DEBUG = "DEBUG"
@@ -83,6 +86,9 @@ _DEFAULTS = {
     _BAYER_PATTERN:         "AUTO",
     _NIGHT_MODE:            1,
     _SAVE_ON_STOP:          0,
+    _SCAN_POLLING_PERIOD:   1,
+    _POST_PROCESS_FRAME_INTERVAL: 1,
+    _USE_SAVER_PROCESS_POOL: 0,
 }
 _MAIN_SECTION_NAME = "main"
 
@@ -320,6 +326,80 @@ def set_www_server_refresh_period(period):
     _set(_WWW_REFRESH_PERIOD, str(period))
 
 
+def get_scan_polling_period():
+    """
+    Retrieves the scan folder polling period, used when the scan folder cannot be watched with native
+    filesystem events, i.e. when it lives on a network share.
+
+    :return: The polling period in seconds, or its default value if config entry
+             is not parsable as an int.
+    :rtype: int
+    """
+    try:
+        return int(_get(_SCAN_POLLING_PERIOD))
+    except ValueError:
+        return _DEFAULTS[_SCAN_POLLING_PERIOD]
+
+
+def set_scan_polling_period(period):
+    """
+    Sets the scan folder polling period.
+
+    :param period: the period in seconds
+    :type period: int
+    """
+    _set(_SCAN_POLLING_PERIOD, str(period))
+
+
+def get_post_process_frame_interval():
+    """
+    Retrieves the post-process frame interval : how many new stack results must accumulate before
+    the post-process chain is run again while processing parameters are left untouched.
+
+    :return: The frame interval, or its default value if config entry is not parsable as an int.
+    :rtype: int
+    """
+    try:
+        return int(_get(_POST_PROCESS_FRAME_INTERVAL))
+    except ValueError:
+        return _DEFAULTS[_POST_PROCESS_FRAME_INTERVAL]
+
+
+def set_post_process_frame_interval(interval):
+    """
+    Sets the post-process frame interval.
+
+    :param interval: the interval, in number of stack results
+    :type interval: int
+    """
+    _set(_POST_PROCESS_FRAME_INTERVAL, str(interval))
+
+
+def set_use_saver_process_pool(use_pool: bool):
+    """
+    Set use saver process pool flag
+
+    :param use_pool: Encode JPEG saves on a process pool ?
+    :type use_pool: bool
+    """
+
+    _set(_USE_SAVER_PROCESS_POOL, "1" if use_pool else "0")
+
+
+def get_use_saver_process_pool():
+    """
+    Get use saver process pool flag
+
+    :return: True if JPEG saves should be encoded on a process pool, False otherwise
+    :rtype: bool
+    """
+
+    try:
+        return _get(_USE_SAVER_PROCESS_POOL) == "1"
+    except ValueError:
+        return _DEFAULTS[_USE_SAVER_PROCESS_POOL]
+
+
 def get_work_folder_path():
     """
     Retrieves work folder path.
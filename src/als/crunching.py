@@ -15,12 +15,16 @@ _LOGGER = logging.getLogger(__name__)
 def compute_histograms_for_display(image, bin_count):
     """
     Compute histograms
+
+    Each histogram is a fresh array owned by the returned container : display code may keep
+    reading it while histograms for later frames are computed
     """
     container = HistogramContainer()
 
     if image.is_color():
         for channel in range(3):
-            container.add_histogram(_compute_single_channel_histogram_for_display(image.data[:, :, channel], bin_count))
+            container.add_histogram(
+                _compute_single_channel_histogram_for_display(image.data[:, :, channel], bin_count))
     else:
         container.add_histogram(_compute_single_channel_histogram_for_display(image.data, bin_count))
 
@@ -32,14 +36,28 @@ def compute_histograms_for_display(image, bin_count):
 @log
 def _compute_single_channel_histogram_for_display(channel_data, bin_count):
 
-    histogram = np.histogram(channel_data, bin_count, range=(0, 2**16 - 1))[0]
+    flat_data = channel_data.ravel()
+
+    # np.bincount is a single O(N) counting pass, where np.histogram performs a binary search
+    # over bin edges for every pixel. We just have to turn pixel values into bin indices first :
+    # a plain shift for integer data when bin count is a power of two, a scale otherwise
+    if np.issubdtype(flat_data.dtype, np.integer) and bin_count & (bin_count - 1) == 0:
+        shift = 16 - (bin_count.bit_length() - 1)
+        bin_indices = flat_data.astype(np.uint16, copy=False) >> shift
+    else:
+        bin_indices = np.clip(
+            (flat_data.astype(np.float32) * (bin_count / 2**16)).astype(np.intp),
+            0,
+            bin_count - 1)
+
+    counts = np.bincount(bin_indices, minlength=bin_count)[:bin_count]
 
     # we set extremity bins' values to 0 to prevent wrong display on clipped histograms
-    histogram[0] = 0
+    counts[0] = 0
 
     for current_bin in reversed(range(0, bin_count)):
-        if histogram[current_bin] > 0:
-            histogram[current_bin] = 0
+        if counts[current_bin] > 0:
+            counts[current_bin] = 0
             break
 
-    return histogram
+    return counts
@@ -4,31 +4,83 @@ Provides everything need to handle ALS main inputs : images.
 We need to read file and in the future, get images from INDI
 """
 import logging
+import os
+import threading
 import time
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
+import numpy as np
 from astropy.io import fits
-from PyQt5.QtCore import QFileInfo, pyqtSignal, QObject, QT_TRANSLATE_NOOP
+from PyQt5.QtCore import pyqtSignal, QObject, QT_TRANSLATE_NOOP
 from rawpy import imread
 from rawpy._rawpy import LibRawNonFatalError, LibRawFatalError
 from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
 from watchdog.observers.polling import PollingObserver
 
+# fitsio wraps CFITSIO and decodes FITS files noticeably faster than astropy,
+# especially tile-compressed ones. It stays an optional speedup : we fall back
+# to astropy when it is not installed
+try:
+    import fitsio
+    _FITSIO_AVAILABLE = True
+except ImportError:
+    _FITSIO_AVAILABLE = False
+
 from als import config
 from als.code_utilities import log
 from als.messaging import MESSAGE_HUB
-from als.model.base import Image
+from als.model.base import Image, IMAGE_BUFFER_POOL
 from als.model.data import DYNAMIC_DATA
 
 _LOGGER = logging.getLogger(__name__)
 
-_IGNORED_FILENAME_START_PATTERNS = ['.', '~', 'tmp']
-_DEFAULT_SCAN_FILE_SIZE_RETRY_PERIOD_IN_SEC = 0.5
+_IGNORED_FILENAME_START_PATTERNS = ('.', '~', 'tmp')
+_FIT_FILE_SUFFIXES = frozenset(('.fit', '.fits', '.fts'))
+
+# file stability check : we start with a short retry period and double it on each check,
+# up to a cap, so small files (the common case) are accepted within a few tens of ms
+# while big ones don't get hammered with stat calls
+_SCAN_FILE_INITIAL_RETRY_PERIOD_IN_SEC = 0.02
+_SCAN_FILE_MAX_RETRY_PERIOD_IN_SEC = 0.5
+_SCAN_FILE_STABILITY_TIMEOUT_IN_SEC = 30
+
+# event debouncing : some platforms report several filesystem events for a single new file
+# (created + modified bursts, duplicated created events...). Events for a path seen less than
+# _EVENT_DEBOUNCE_PERIOD_IN_SEC ago are dropped. Old entries are garbage collected past
+# _EVENT_DEBOUNCE_GC_AGE_IN_SEC
+_EVENT_DEBOUNCE_PERIOD_IN_SEC = 0.5
+_EVENT_DEBOUNCE_GC_AGE_IN_SEC = 10
+
+# newly read images are broadcast in batches : images read less than this long after the first
+# pending one travel in the same signal emission, sparing cross-thread Qt dispatches on bursts
+_BROADCAST_BATCH_WINDOW_IN_SEC = 0.05
+
+# filesystem types for which native event notification is unreliable. Scan folders living on
+# such filesystems are watched with the good old polling observer
+_NETWORK_FS_TYPES = frozenset([
+    'nfs', 'nfs4', 'cifs', 'smbfs', 'smb3', 'ncpfs', 'afs', '9p', 'fuse.sshfs'
+])
 
 SCANNER_TYPE_FILESYSTEM = "FS"
 
 
+def recycle(buffer):
+    """
+    Hands a decode buffer back to the application-wide buffer pool.
+
+    Meant to be called by downstream processes when they replace an image's data array : if the
+    discarded array came from the pool, it is made available to the next decoded frame.
+
+    :param buffer: the discarded array
+    :type buffer: numpy.ndarray
+    """
+    IMAGE_BUFFER_POOL.release(buffer)
+
+
 class InputError(Exception):
     """
     Base class for all Exception subclasses in this module
@@ -41,10 +93,14 @@ class ScannerStartError(InputError):
     """
 
 
-class InputScanner:
+class InputScanner(QObject):
     """
     Base abstract class for all code responsible of ALS "image acquisition".
 
+    Inherits QObject so the signals declared here are guaranteed to work : a pyqtSignal on a
+    plain Python class silently never emits. Subclasses with extra bases must initialize with a
+    single cooperative super().__init__() call.
+
     Subclasses are responsible for :
 
       - replying to start & stop commands
@@ -53,19 +109,50 @@ class InputScanner:
       - broadcasting every new image
     """
 
-    new_image_signal = pyqtSignal(Image)
-    """Qt signal emitted when a new image is read by scanner"""
+    new_images_signal = pyqtSignal(list)
+    """Qt signal emitted when a batch of new images is read by scanner"""
+
+    def __init__(self):
+        super().__init__()
+        self._pending_images = list()
+        self._pending_images_lock = threading.Lock()
+        self._batch_flush_timer = None
 
-    @log
     def broadcast_image(self, image: Image):
         """
-        Send a signal with newly read image to anyone who cares
+        Send a signal with newly read image to anyone who cares.
+
+        Emission is coalesced : the image joins a pending batch, flushed as a single signal
+        once the batching window closes. When a burst of files arrives, downstream listeners
+        get one cross-thread dispatch instead of one per image.
 
         :param image: the new image
         :type image: Image
         """
-        if image is not None:
-            self.new_image_signal.emit(image)
+        if image is None:
+            return
+
+        with self._pending_images_lock:
+            self._pending_images.append(image)
+
+            if self._batch_flush_timer is None:
+                self._batch_flush_timer = threading.Timer(
+                    _BROADCAST_BATCH_WINDOW_IN_SEC,
+                    self._flush_pending_images)
+                self._batch_flush_timer.daemon = True
+                self._batch_flush_timer.start()
+
+    def _flush_pending_images(self):
+        """
+        Emits all pending images as one batch
+        """
+        with self._pending_images_lock:
+            batch = self._pending_images
+            self._pending_images = list()
+            self._batch_flush_timer = None
+
+        if batch:
+            self.new_images_signal.emit(batch)
 
     @abstractmethod
     def start(self):
@@ -97,13 +184,13 @@ class InputScanner:
         :rtype: InputScanner subclass
         """
 
-        if scanner_type == SCANNER_TYPE_FILESYSTEM:
-            return FolderScanner()
-
-        raise ValueError(f"Unsupported scanner type : {scanner_type}")
+        try:
+            return _SCANNER_REGISTRY[scanner_type]()
+        except KeyError:
+            raise ValueError(f"Unsupported scanner type : {scanner_type}")
 
 
-class FolderScanner(FileSystemEventHandler, InputScanner, QObject):
+class FolderScanner(FileSystemEventHandler, InputScanner):
     """
     Watches file changes (creation, move) in a specific filesystem folder
 
@@ -111,10 +198,15 @@ class FolderScanner(FileSystemEventHandler, InputScanner, QObject):
     """
     @log
     def __init__(self):
-        FileSystemEventHandler.__init__(self)
-        InputScanner.__init__(self)
-        QObject.__init__(self)
+        super().__init__()
         self._observer = None
+        self._executor = None
+        self._recent_event_times = dict()
+        self._recent_event_times_lock = threading.Lock()
+
+        # reader memoized from the first scanned file : scan folders hold a single
+        # image format per session, so the suffix check runs once, not per frame
+        self._reader = None
 
     @log
     def start(self):
@@ -123,7 +215,18 @@ class FolderScanner(FileSystemEventHandler, InputScanner, QObject):
         """
         try:
             scan_folder_path = config.get_scan_folder_path()
-            self._observer = PollingObserver()
+
+            if _folder_is_on_network_share(Path(scan_folder_path)):
+                _LOGGER.debug("Scan folder is on a network share. Using polling observer")
+                self._observer = PollingObserver(timeout=config.get_scan_polling_period())
+            else:
+                _LOGGER.debug("Scan folder is on a local filesystem. Using native observer")
+                self._observer = Observer()
+
+            self._executor = ThreadPoolExecutor(
+                max_workers=min(4, os.cpu_count() or 1),
+                thread_name_prefix="FileIngest")
+
             self._observer.schedule(self, scan_folder_path, recursive=False)
             self._observer.start()
         except OSError as os_error:
@@ -138,37 +241,164 @@ class FolderScanner(FileSystemEventHandler, InputScanner, QObject):
             self._observer.stop()
             self._observer = None
 
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+        with self._recent_event_times_lock:
+            self._recent_event_times.clear()
+
+        self._reader = None
+
     @log
     def on_moved(self, event):
         if event.event_type == 'moved':
             image_path = event.dest_path
             _LOGGER.debug(f"File move detected : {image_path}")
-
-            FolderScanner.wait_for_resources()
-            self.broadcast_image(read_disk_image(Path(image_path)))
+            self._submit_ingest(image_path, check_stability=False)
 
     @log
     def on_created(self, event):
         if event.event_type == 'created':
-            file_is_incomplete = True
-            last_file_size = -1
             image_path = event.src_path
             _LOGGER.debug(f"File creation detected : {image_path}. Waiting until file is complete and readable ...")
+            self._submit_ingest(image_path, check_stability=True)
+
+    @log
+    def _submit_ingest(self, image_path: str, check_stability: bool):
+        """
+        Posts a file ingestion job to our worker pool, so disk reads and image decoding don't block
+        the filesystem observer thread.
+
+        :param image_path: path of the file to ingest
+        :type image_path: str
+
+        :param check_stability: do we wait until the file stops changing before reading it ?
+        :type check_stability: bool
+        """
+        if self._is_duplicate_event(image_path):
+            _LOGGER.debug(f"Duplicate filesystem event for {image_path} dropped")
+            return
+
+        if self._executor is not None:
+            future = self._executor.submit(self._ingest, image_path, check_stability)
+            future.add_done_callback(partial(FolderScanner._on_ingest_done, image_path))
+
+    @staticmethod
+    def _on_ingest_done(image_path: str, future):
+        """
+        Surfaces any exception that escaped an ingestion job.
+
+        Executor futures swallow their job's exception until someone asks for it : without this
+        callback, an unexpected failure while reading a frame would disappear silently.
+
+        :param image_path: path of the file the job was ingesting
+        :type image_path: str
+
+        :param future: the completed job
+        :type future: concurrent.futures.Future
+        """
+        error = future.exception()
+
+        if error is not None:
+            _LOGGER.error(f"Unexpected error while ingesting file {image_path}", exc_info=error)
+            _report_fs_error(image_path, error)
+
+    @log
+    def _is_duplicate_event(self, image_path: str):
+        """
+        Tells if an event for this path was already seen within the debounce period.
+
+        As a side effect, records current event time and garbage-collects stale entries.
+
+        :param image_path: path the event was fired for
+        :type image_path: str
+
+        :return: True if this event is a duplicate and must be dropped, False otherwise
+        :rtype: bool
+        """
+        now = time.monotonic()
+
+        with self._recent_event_times_lock:
+
+            if now - self._recent_event_times.get(image_path, -_EVENT_DEBOUNCE_GC_AGE_IN_SEC) \
+                    < _EVENT_DEBOUNCE_PERIOD_IN_SEC:
+                return True
+
+            self._recent_event_times[image_path] = now
+
+            self._recent_event_times = {
+                path: event_time for path, event_time in self._recent_event_times.items()
+                if now - event_time < _EVENT_DEBOUNCE_GC_AGE_IN_SEC
+            }
+
+        return False
+
+    @log
+    def _ingest(self, image_path: str, check_stability: bool):
+        """
+        Reads an image from a file and broadcasts it. Runs on a worker pool thread.
+
+        :param image_path: path of the file to ingest
+        :type image_path: str
+
+        :param check_stability: do we wait until the file stops changing before reading it ?
+        :type check_stability: bool
+        """
+        if check_stability and not FolderScanner._wait_until_file_is_stable(image_path):
+            MESSAGE_HUB.dispatch_error(
+                __name__,
+                QT_TRANSLATE_NOOP("", "File {} is still being written after {} seconds. It is ignored"),
+                [image_path, _SCAN_FILE_STABILITY_TIMEOUT_IN_SEC])
+            return
+
+        FolderScanner.wait_for_resources()
+
+        path = Path(image_path)
 
-            while file_is_incomplete:
-                info = QFileInfo(image_path)
-                size = info.size()
-                _LOGGER.debug(f"File {image_path}'s size = {size}")
-                if size == last_file_size:
-                    file_is_incomplete = False
-                    _LOGGER.debug(f"File {image_path} is ready to be read")
-                last_file_size = size
+        if self._reader is None and not path.name.startswith(_IGNORED_FILENAME_START_PATTERNS):
+            self._reader = _select_reader(path)
 
-                if file_is_incomplete:
-                    time.sleep(_DEFAULT_SCAN_FILE_SIZE_RETRY_PERIOD_IN_SEC)
+        self.broadcast_image(read_disk_image(path, self._reader))
 
-            FolderScanner.wait_for_resources()
-            self.broadcast_image(read_disk_image(Path(image_path)))
+    @staticmethod
+    @log
+    def _wait_until_file_is_stable(file_path: str):
+        """
+        Waits until a file's size and modification time stop changing, meaning its writer is done.
+
+        Successive checks are performed with an exponential backoff, starting at
+        _SCAN_FILE_INITIAL_RETRY_PERIOD_IN_SEC and capped at _SCAN_FILE_MAX_RETRY_PERIOD_IN_SEC.
+
+        :param file_path: path of the file to watch
+        :type file_path: str
+
+        :return: True if file is stable, False if it kept changing until timeout
+        :rtype: bool
+        """
+        last_file_state = None
+        retry_period = _SCAN_FILE_INITIAL_RETRY_PERIOD_IN_SEC
+        deadline = time.monotonic() + _SCAN_FILE_STABILITY_TIMEOUT_IN_SEC
+
+        while time.monotonic() < deadline:
+
+            try:
+                stats = os.stat(file_path)
+                file_state = (stats.st_size, stats.st_mtime_ns)
+            except OSError:
+                file_state = None
+
+            # a just-created file can be stat'ed twice before its writer puts any byte in it :
+            # an empty file is never considered stable
+            if file_state is not None and file_state[0] > 0 and file_state == last_file_state:
+                _LOGGER.debug(f"File {file_path} is ready to be read")
+                return True
+
+            last_file_state = file_state
+            time.sleep(retry_period)
+            retry_period = min(retry_period * 2, _SCAN_FILE_MAX_RETRY_PERIOD_IN_SEC)
+
+        return False
 
     @staticmethod
     @log
@@ -176,72 +406,162 @@ class FolderScanner(FileSystemEventHandler, InputScanner, QObject):
         """
         make current thread (file read) wait for pre-processor and stacker (and respective queues) to be free
 
+        Instead of polling, we sleep on DYNAMIC_DATA.workers_idle_condition, which is notified by the
+        Controller whenever a downstream worker goes idle or its queue drains. The wait still uses a
+        1 second timeout as a safety net, so a missed notification cannot hang us forever.
+
         #TODO: Move this logic to Controller
         """
-        while (not DYNAMIC_DATA.session.is_stopped) and \
-                (DYNAMIC_DATA.stacker_busy or DYNAMIC_DATA.pre_processor_busy or
-                 DYNAMIC_DATA.stacker_queue.qsize() > 0 or DYNAMIC_DATA.pre_process_queue.qsize() > 0):
-            _LOGGER.debug(f"Waiting for downstream workers to be free...")
-            time.sleep(1)
+        def _downstream_workers_are_free():
+            return DYNAMIC_DATA.session.is_stopped or \
+                not (DYNAMIC_DATA.stacker_busy or DYNAMIC_DATA.pre_processor_busy or
+                     DYNAMIC_DATA.stacker_queue.qsize() > 0 or DYNAMIC_DATA.pre_process_queue.qsize() > 0)
+
+        with DYNAMIC_DATA.workers_idle_condition:
+            while not _downstream_workers_are_free():
+                _LOGGER.debug("Waiting for downstream workers to be free...")
+                DYNAMIC_DATA.workers_idle_condition.wait(timeout=1)
+
+
+# registry used by InputScanner.create_scanner, mapping scanner type codes to
+# concrete scanner classes. Defined here as it needs the classes above
+_SCANNER_REGISTRY = {
+    SCANNER_TYPE_FILESYSTEM: FolderScanner,
+}
+
+
+@log
+def _folder_is_on_network_share(path: Path):
+    """
+    Tells if a folder is stored on a network share.
+
+    Detection is only performed on Linux, by looking up the filesystem type of the mount point
+    holding the folder in /proc/self/mountinfo. On other platforms, we assume a local filesystem.
+
+    :param path: path of the folder to check
+    :type path: pathlib.Path
+
+    :return: True if folder is known to be stored on a network share, False otherwise
+    :rtype: bool
+    """
+    try:
+        resolved = str(path.resolve())
+        best_match_length = -1
+        best_match_fs_type = ""
+
+        with open("/proc/self/mountinfo") as mount_info_file:
+            for line in mount_info_file:
+                fields = line.split()
+                mount_point = fields[4]
+                fs_type = fields[fields.index('-') + 1]
+
+                if resolved.startswith(mount_point) and len(mount_point) > best_match_length:
+                    best_match_length = len(mount_point)
+                    best_match_fs_type = fs_type
+
+        return best_match_fs_type.lower() in _NETWORK_FS_TYPES
+
+    except (OSError, ValueError, IndexError):
+        return False
+
+
+@log
+def _select_reader(path: Path):
+    """
+    Picks the reader function matching a file's suffix
+
+    :param path: path of the file to be read
+    :type path: pathlib.Path
+
+    :return: the reader to use
+    :rtype: function
+    """
+    return _read_fit_image if path.suffix.lower() in _FIT_FILE_SUFFIXES else _read_raw_image
 
 
 @log
-def read_disk_image(path: Path):
+def read_disk_image(path: Path, reader=None):
     """
     Reads an image from disk
 
     :param path: path to the file to load image from
     :type path:  pathlib.Path
 
+    :param reader: the reader function to use. Selected from the file suffix if None. Callers
+                   reading many files of a known format may pass a memoized reader to skip the
+                   per-file suffix check
+    :type reader: function or None
+
     :return: the image read from disk or None if image is ignored or an error occurred
     :rtype: Image or None
     """
 
-    ignore_image = False
-    image = None
+    if path.name.startswith(_IGNORED_FILENAME_START_PATTERNS):
+        return None
+
+    # resolved once here and passed along : resolution costs filesystem syscalls
+    resolved_path = str(path.resolve())
 
-    for pattern in _IGNORED_FILENAME_START_PATTERNS:
-        if path.name.startswith(pattern):
-            ignore_image = True
-            break
+    if reader is None:
+        reader = _select_reader(path)
 
-    if not ignore_image:
-        if path.suffix.lower() in ['.fit', '.fits', '.fts']:
-            image = _read_fit_image(path)
-        else:
-            image = _read_raw_image(path)
+    image = reader(resolved_path)
 
-        if image is not None:
-            MESSAGE_HUB.dispatch_info(
-                __name__,
-                QT_TRANSLATE_NOOP("", "Successful image read from {}"),
-                [image.origin, ]
-            )
+    if image is not None:
+        MESSAGE_HUB.dispatch_info(
+            __name__,
+            QT_TRANSLATE_NOOP("", "Successful image read from {}"),
+            [image.origin, ]
+        )
 
     return image
 
 
 @log
-def _read_fit_image(path: Path):
+def _read_fit_image(path: str):
     """
     read FIT image from filesystem
 
-    :param path: path to image file to load from
-    :type path: pathlib.Path
+    :param path: resolved path to image file to load from
+    :type path: str
 
     :return: the loaded image, with data and headers parsed or None if a known error occurred
     :rtype: Image or None
     """
     try:
-        with fits.open(str(path.resolve())) as fit:
-            # pylint: disable=E1101
-            data = fit[0].data
-            header = fit[0].header
+        if _FITSIO_AVAILABLE:
+            with fitsio.FITS(path) as fits_file:
+                data = fits_file[0].read()
+                header = fits_file[0].read_header()
+        else:
+            # the file is opened memory-mapped, so astropy does not materialize the whole frame on open.
+            # We make a single contiguous copy of the primary HDU's pixels while the mapping is alive,
+            # as downstream processes need an owned, writable buffer
+            # files in the scan folder are local acquisition output, i.e. trusted : no checksum
+            # verification, and a missing END card is tolerated rather than rejected
+            with fits.open(path,
+                           mode='readonly',
+                           memmap=True,
+                           lazy_load_hdus=True,
+                           checksum=False,
+                           ignore_missing_end=True,
+                           do_not_scale_image_data=True) as fit:
+                # pylint: disable=E1101
+                mapped_data = fit[0].data
+
+                # FITS stores pixels big-endian and the mapping keeps that byte order. The copy
+                # is made into a native-order buffer : downstream numba kernels only accept
+                # native dtypes, and byte-swapping here rides along the copy for free
+                data = IMAGE_BUFFER_POOL.acquire(mapped_data.shape, mapped_data.dtype.newbyteorder('='))
+                np.copyto(data, mapped_data)
+                header = fit[0].header
+
+            data = _apply_fits_scaling(data, header)
 
         image = Image(data)
 
         if 'BAYERPAT' in header:
-            image.bayer_pattern = header['BAYERPAT']
+            image.bayer_pattern = str(header['BAYERPAT']).strip()
 
         _set_image_file_origin(image, path)
 
@@ -253,19 +573,67 @@ def _read_fit_image(path: Path):
 
 
 @log
-def _read_raw_image(path: Path):
+def _apply_fits_scaling(data, header):
+    """
+    Applies a FITS header's BSCALE/BZERO linear transform to raw pixel data.
+
+    Data is read unscaled (do_not_scale_image_data=True), as astropy's own scaling materializes
+    an extra float array even in cases where no float math is needed. We handle scaling ourselves :
+
+      - no transform at all for the common (BSCALE=1, BZERO=0) case
+
+      - an in-place wraparound add on a uint16 view for the pseudo-unsigned 16 bits convention
+        (int16 data with BSCALE=1, BZERO=32768), restoring physical values without any float
+        conversion or extra buffer
+
+      - a single fused float32 pass for every other transform
+
+    :param data: the raw pixel data
+    :type data: numpy.ndarray
+
+    :param header: the FITS header
+    :type header: astropy.io.fits.Header
+
+    :return: the pixel data, with physical values restored
+    :rtype: numpy.ndarray
+    """
+    bscale = header.get('BSCALE', 1)
+    bzero = header.get('BZERO', 0)
+
+    if bscale == 1 and bzero == 0:
+        return data
+
+    # kind/itemsize comparison on purpose : a dtype equality test would miss big-endian '>i2'
+    # data, silently sending every pseudo-unsigned camera frame down the float path
+    if bscale == 1 and bzero == 32768 and data.dtype.kind == 'i' and data.dtype.itemsize == 2:
+        unsigned_view = data.view(data.dtype.str.replace('i', 'u'))
+        unsigned_view += np.uint16(32768)
+        return unsigned_view
+
+    scaled_data = np.float32(data)
+    scaled_data *= bscale
+    scaled_data += bzero
+
+    # the float conversion leaves the pooled decode buffer behind : hand it back now
+    IMAGE_BUFFER_POOL.release(data)
+
+    return scaled_data
+
+
+@log
+def _read_raw_image(path: str):
     """
     Reads a RAW DLSR image from file
 
-    :param path: path to the file to read from
-    :type path: pathlib.Path
+    :param path: resolved path to the file to read from
+    :type path: str
 
     :return: the image or None if a known error occurred
     :rtype: Image or None
     """
 
     try:
-        with imread(str(path.resolve())) as raw_image:
+        with imread(path) as raw_image:
 
             # in here, we make sure we store the bayer pattern as it would be advertised if image was a FITS image.
             #
@@ -310,20 +678,24 @@ def _read_raw_image(path: Path):
             # | 2 | 3 |
             # +---+---+
             bayer_pattern_indices = raw_image.raw_pattern.flatten()
-            bayer_pattern_desc = raw_image.color_desc.decode()
+            bayer_pattern_desc = np.frombuffer(raw_image.color_desc, dtype=np.uint8)
 
             _LOGGER.debug(f"Bayer pattern indices = {bayer_pattern_indices}")
-            _LOGGER.debug(f"Bayer pattern description = {bayer_pattern_desc}")
+            _LOGGER.debug(f"Bayer pattern description = {raw_image.color_desc}")
 
-            assert len(bayer_pattern_indices) == len(bayer_pattern_desc)
-            bayer_pattern = ""
-            for i, index in enumerate(bayer_pattern_indices):
-                assert bayer_pattern_indices[i] < len(bayer_pattern_indices)
-                bayer_pattern += bayer_pattern_desc[index]
+            assert bayer_pattern_indices.size == bayer_pattern_desc.size
+            assert bayer_pattern_indices.max() < bayer_pattern_desc.size
+            bayer_pattern = bayer_pattern_desc[bayer_pattern_indices].tobytes().decode('ascii')
 
             _LOGGER.debug(f"Computed, FITS-compatible bayer pattern = {bayer_pattern}")
 
-            new_image = Image(raw_image.raw_image_visible.copy())
+            # explicit buffer + copyto : the memcpy from the LibRaw-owned view runs without
+            # the GIL, so concurrent ingest workers can decode other frames meanwhile
+            visible = raw_image.raw_image_visible
+            raw_data = IMAGE_BUFFER_POOL.acquire(visible.shape, visible.dtype)
+            np.copyto(raw_data, visible)
+
+            new_image = Image(raw_data)
             new_image.bayer_pattern = bayer_pattern
             _set_image_file_origin(new_image, path)
             return new_image
@@ -337,13 +709,13 @@ def _read_raw_image(path: Path):
 
 
 @log
-def _report_fs_error(path: Path, error: Exception):
+def _report_fs_error(path: str, error: Exception):
     MESSAGE_HUB.dispatch_error(
         __name__,
         QT_TRANSLATE_NOOP("", "Error reading from file {} : {}"),
-        [str(path.resolve()), str(error)])
+        [path, str(error)])
 
 
 @log
-def _set_image_file_origin(image: Image, path: Path):
-    image.origin = f"FILE : {str(path.resolve())}"
+def _set_image_file_origin(image: Image, path: str):
+    image.origin = f"FILE : {path}"
@@ -14,12 +14,40 @@ from PyQt5.QtCore import QT_TRANSLATE_NOOP
 import als.model.data
 from als.code_utilities import log, SignalingQueue
 from als.messaging import MESSAGE_HUB
-from als.model.base import Image
+from als.model.base import Image, IMAGE_BUFFER_POOL
 from als.processing import QueueConsumer
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def encode_and_write_jpeg(data, is_color: bool, target_path: str):
+    """
+    Encodes image data as JPEG and writes it to disk.
+
+    Kept as a self-contained module-level function on purpose : it must be picklable, so the
+    Controller can run it on a process pool when per-frame saving is asked to scale across
+    cores. Data is expected as unsigned 16 bits, as produced by the post-process pipeline.
+
+    :param data: the image data, unsigned 16 bits
+    :type data: numpy.ndarray
+
+    :param is_color: does data carry color information ?
+    :type is_color: bool
+
+    :param target_path: the absolute path of the image file to save to
+    :type target_path: str
+
+    :return: True if save succeeded, False otherwise
+    :rtype: bool
+    """
+    data = (data / (((2 ** 16) - 1) / ((2 ** 8) - 1))).astype('uint8')
+    cv2_color_conversion_flag = cv2.COLOR_RGB2BGR if is_color else cv2.COLOR_GRAY2BGR
+
+    return cv2.imwrite(target_path,
+                       cv2.cvtColor(data, cv2_color_conversion_flag),
+                       [int(cv2.IMWRITE_JPEG_QUALITY), 90])
+
+
 class ImageSaver(QueueConsumer):
     """
     Saves images according to commands posted to IMAGE_SAVE_QUEUE in its own thread
@@ -34,6 +62,9 @@ class ImageSaver(QueueConsumer):
 
         ImageSaver._save_image(image)
 
+        # we are the end of the line for this image : its pixel buffer goes back to the pool
+        image.release()
+
     @staticmethod
     @log
     def _save_image(image):
@@ -152,7 +183,9 @@ class ImageSaver(QueueConsumer):
         be the empty string.
         """
         # here we are sure that image data type is unsigned 16 bits. We need to downscale to 8 bits
-        image.data = (image.data / (((2 ** 16) - 1) / ((2 ** 8) - 1))).astype('uint8')
+        original_data = image.data
+        image.data = (original_data / (((2 ** 16) - 1) / ((2 ** 8) - 1))).astype('uint8')
+        IMAGE_BUFFER_POOL.release(original_data)
         cv2_color_conversion_flag = cv2.COLOR_RGB2BGR if image.is_color() else cv2.COLOR_GRAY2BGR
 
         return cv2.imwrite(target_path,
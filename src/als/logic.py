@@ -20,18 +20,21 @@
 Module holding all application logic
 """
 import logging
+import os
 
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import List
 
-from PyQt5.QtCore import QFile, QT_TRANSLATE_NOOP, QCoreApplication
+from PyQt5.QtCore import QT_TRANSLATE_NOOP, QCoreApplication, QTimer
 
 from als import config
-from als.code_utilities import log, AlsException, SignalingQueue, get_text_content_of_resource, get_timestamp
-from als.crunching import compute_histograms_for_display
+from als.code_utilities import log, AlsException, SignalingQueue, get_text_content_of_resource, \
+    get_binary_content_of_resource, get_timestamp_for_filename
 from als.io.input import InputScanner, ScannerStartError
 from als.io.network import get_ip, WebServer
-from als.io.output import ImageSaver
+from als.io.output import ImageSaver, encode_and_write_jpeg
 from als.messaging import MESSAGE_HUB
 from als.model.base import Image, Session
 from als.model.data import (
@@ -41,12 +44,24 @@ from als.model.data import (
 )
 from als.model.params import ProcessingParameter
 from als.processing import Pipeline, Debayer, Standardize, ConvertForOutput, Levels, ColorBalance, AutoStretch, \
-    HotPixelRemover, RemoveDark
+    ComputeHistograms, FusedTonePipeline, FusedPreProcess
 from als.stack import Stacker
 
 
 _LOGGER = logging.getLogger(__name__)
 
+# bytes of Qt resources installed as web static assets, cached on first use : resources are
+# baked into the binary and never change for the process lifetime
+_STATIC_ASSET_BYTES_CACHE = dict()
+
+# on-disk cache where web static assets are extracted once, then hardlinked into web folders :
+# linking is a constant-time metadata operation where copying is proportional to asset size
+_STATIC_ASSET_CACHE_DIR = Path.home() / ".cache" / "als"
+
+# index.html template text, read from the Qt resource system on first use then kept for the
+# process lifetime : only the tiny placeholder substitution is redone per session start
+_INDEX_TEMPLATE = None
+
 
 class SessionError(AlsException):
     """
@@ -88,7 +103,7 @@ class Controller:
         self._pre_process_pipeline: Pipeline = Pipeline(
             'pre-process',
             self._pre_process_queue,
-            [RemoveDark(), HotPixelRemover(), Debayer(), Standardize()])
+            [FusedPreProcess(), Debayer(), Standardize()])
         self._pre_process_pipeline.start()
 
         self._stacker_queue: SignalingQueue = DYNAMIC_DATA.stacker_queue
@@ -98,25 +113,44 @@ class Controller:
         self._stacker.start()
 
         self._post_process_queue = DYNAMIC_DATA.process_queue
-        self._post_process_pipeline: Pipeline = Pipeline('post-process', self._post_process_queue, [ConvertForOutput()])
+        self._post_process_pipeline: Pipeline = Pipeline(
+            'post-process',
+            self._post_process_queue,
+            [ConvertForOutput(), ComputeHistograms(Controller._BIN_COUNT)])
         self._rgb_processor = ColorBalance()
         self._autostretch_processor = AutoStretch()
         self._levels_processor = Levels()
-        self._post_process_pipeline.add_process(self._autostretch_processor)
-        self._post_process_pipeline.add_process(self._levels_processor)
-        self._post_process_pipeline.add_process(self._rgb_processor)
+        self._post_process_pipeline.add_process(
+            FusedTonePipeline(self._autostretch_processor, self._levels_processor, self._rgb_processor))
         self._post_process_pipeline.start()
 
         self._saver_queue = DYNAMIC_DATA.save_queue
         self._saver = ImageSaver(self._saver_queue)
         self._saver.start()
 
+        # optional process pool for JPEG encoding : per-frame saving can then scale across
+        # cores instead of serializing behind the single saver thread
+        self._saver_executor = ProcessPoolExecutor(max_workers=os.cpu_count()) \
+            if config.get_use_saver_process_pool() else None
+
         self._last_stacking_result = None
         self._web_server = None
 
-        self._model_observers = list()
-
-        self._input_scanner.new_image_signal[Image].connect(self.on_new_image_read)
+        # post-process skipping state : parameter edits bump the version, and stack results
+        # arriving while the version is unchanged only trigger the post-process chain once
+        # every configured frame interval
+        self._post_params_version = 0
+        self._last_processed_params_version = -1
+        self._stacks_since_last_post_process = 0
+
+        # observers live in a dict keyed on their id, used as an ordered set : removal is O(1)
+        # and iteration order remains registration order
+        self._model_observers = dict()
+        self._observer_notification_is_scheduled = False
+        self._full_notification_is_pending = False
+        self._image_only_notification_is_pending = False
+
+        self._input_scanner.new_images_signal[list].connect(self.on_new_images_read)
         self._pre_process_pipeline.new_result_signal[Image].connect(self.on_new_pre_processed_image)
         self._stacker.stack_size_changed_signal[int].connect(self.on_stack_size_changed)
         self._stacker.new_result_signal[Image].connect(self.on_new_stack_result)
@@ -173,16 +207,45 @@ class Controller:
         :param observer: the observer to remove
         :type observer: any
         """
-        if observer in self._model_observers:
-            self._model_observers.remove(observer)
+        self._model_observers.pop(id(observer), None)
 
     @log
     def _notify_model_observers(self, image_only=False):
         """
-        Tells all registered observers to update their display
+        Tells all registered observers to update their display.
+
+        Notifications are coalesced : instead of refreshing observers on each call, we record the
+        request and schedule a single flush on the next event loop turn. The bursts of queue size /
+        busy state changes fired while the pipeline churns then cost one display refresh, not one
+        per signal. Image-only and full requests are recorded separately, as observers treat them
+        as distinct updates : each kind pending within a burst is flushed once.
+        """
+        if image_only:
+            self._image_only_notification_is_pending = True
+        else:
+            self._full_notification_is_pending = True
+
+        if not self._observer_notification_is_scheduled:
+            self._observer_notification_is_scheduled = True
+            QTimer.singleShot(0, self._flush_model_observer_notification)
+
+    @log
+    def _flush_model_observer_notification(self):
+        """
+        Performs the display updates coalesced from all notification requests of the last
+        event loop turn : at most one full update and one image update per observer
         """
-        for observer in self._model_observers:
-            observer.update_display(image_only)
+        full_is_pending = self._full_notification_is_pending
+        image_only_is_pending = self._image_only_notification_is_pending
+        self._observer_notification_is_scheduled = False
+        self._full_notification_is_pending = False
+        self._image_only_notification_is_pending = False
+
+        for observer in self._model_observers.values():
+            if full_is_pending:
+                observer.update_display(image_only=False)
+            if image_only_is_pending:
+                observer.update_display(image_only=True)
 
     @log
     def add_model_observer(self, observer):
@@ -192,15 +255,19 @@ class Controller:
         :param observer: the new observer
         :type observer: any
         """
-        self._model_observers.append(observer)
+        self._model_observers[id(observer)] = observer
 
     @log
     def apply_processing(self):
         """
         Apply processing on last stacking result
         """
+        self._post_params_version += 1
+
         if self._stacker.size > 0 and DYNAMIC_DATA.process_queue.qsize() == 0:
 
+            self._last_processed_params_version = self._post_params_version
+            self._stacks_since_last_post_process = 0
             DYNAMIC_DATA.process_queue.put(self._last_stacking_result.clone())
 
     @log
@@ -263,7 +330,6 @@ class Controller:
         """
         self._stacker.stacking_mode = mode
 
-    @log
     def on_stack_size_changed(self, size):
         """
         Stack size just changed
@@ -283,7 +349,14 @@ class Controller:
         :type image: Image
         """
         image.origin = "Process result"
-        DYNAMIC_DATA.histogram_container = compute_histograms_for_display(image, Controller._BIN_COUNT)
+
+        # the replaced result's pixel buffer goes back to the pool : display code copies the
+        # pixels it paints and save paths copy at submit time, so nobody reads it anymore
+        previous_result = DYNAMIC_DATA.post_processor_result
+        if previous_result is not None and previous_result is not image:
+            previous_result.release()
+
+        DYNAMIC_DATA.histogram_container = image.histogram
         DYNAMIC_DATA.post_processor_result = image
         self._notify_model_observers(image_only=True)
         self.save_post_process_result()
@@ -297,20 +370,36 @@ class Controller:
         :type image: Image
         """
         image.origin = "Stacking result"
-        self._last_stacking_result = image.clone()
+
+        # the stacker hands us a fresh image : we keep it as is and pass the post-process queue
+        # a shallow clone sharing its pixels. Every post-process stage rebinds data to a new
+        # array before mutating, so the shared array is never written to
+        self._last_stacking_result = image
+        self._stacks_since_last_post_process += 1
+
+        # while the user leaves processing parameters untouched, the displayed result only gains
+        # one more averaged frame per stack : re-running the full post-process chain for each of
+        # them is configurable. The default interval of 1 processes every stack result
+        if self._post_params_version == self._last_processed_params_version \
+                and self._stacks_since_last_post_process < config.get_post_process_frame_interval():
+            return
+
+        self._last_processed_params_version = self._post_params_version
+        self._stacks_since_last_post_process = 0
 
         self.purge_queue(self._post_process_queue)
-        self._post_process_queue.put(image.clone())
+        self._post_process_queue.put(image.shallow_clone())
 
     @log
-    def on_new_image_read(self, image: Image):
+    def on_new_images_read(self, images: List[Image]):
         """
-        A new image as been read by input scanner
+        A batch of new images has been read by input scanner
 
-        :param image: the new image
-        :type image: Image
+        :param images: the new images
+        :type images: List[Image]
         """
-        self._pre_process_queue.put(image)
+        for image in images:
+            self._pre_process_queue.put(image)
 
     @log
     def on_new_pre_processed_image(self, image: Image):
@@ -322,7 +411,15 @@ class Controller:
         """
         self._stacker_queue.put(image)
 
+    @staticmethod
     @log
+    def _wake_waiting_scanners():
+        """
+        Notifies threads sleeping on the workers idle condition that worker state just changed
+        """
+        with DYNAMIC_DATA.workers_idle_condition:
+            DYNAMIC_DATA.workers_idle_condition.notify_all()
+
     def on_pre_process_queue_size_changed(self, new_size):
         """
         Qt slot executed when an item has just been pushed to the pre-processor queue
@@ -330,10 +427,11 @@ class Controller:
         :param new_size: new queue size
         :type new_size: int
         """
-        _LOGGER.debug(f"New pre-processor queue size : {new_size}")
+        _LOGGER.debug("New pre-processor queue size : %d", new_size)
+        if new_size == 0:
+            Controller._wake_waiting_scanners()
         self._notify_model_observers()
 
-    @log
     def on_stacker_queue_size_changed(self, new_size):
         """
         Qt slot executed when an item has just been pushed to the stacker queue
@@ -341,10 +439,11 @@ class Controller:
         :param new_size: new queue size
         :type new_size: int
         """
-        _LOGGER.debug(f"New stacker queue size : {new_size}")
+        _LOGGER.debug("New stacker queue size : %d", new_size)
+        if new_size == 0:
+            Controller._wake_waiting_scanners()
         self._notify_model_observers()
 
-    @log
     def on_post_processor_queue_size_changed(self, new_size):
         """
         Qt slot executed when an item has just been pushed to the process queue
@@ -352,10 +451,9 @@ class Controller:
         :param new_size: new queue size
         :type new_size: int
         """
-        _LOGGER.debug(f"New post-processor queue size : {new_size}")
+        _LOGGER.debug("New post-processor queue size : %d", new_size)
         self._notify_model_observers()
 
-    @log
     def on_saver_queue_size_changed(self, new_size):
         """
         Qt slot executed when an item has just been pushed to the save queue
@@ -363,10 +461,9 @@ class Controller:
         :param new_size: new queue size
         :type new_size: int
         """
-        _LOGGER.debug(f"New saver queue size : {new_size}")
+        _LOGGER.debug("New saver queue size : %d", new_size)
         self._notify_model_observers()
 
-    @log
     def on_pre_processor_busy(self):
         """
         pre-processor just started working on new image
@@ -374,15 +471,14 @@ class Controller:
         DYNAMIC_DATA.pre_processor_busy = True
         self._notify_model_observers()
 
-    @log
     def on_pre_processor_waiting(self):
         """
         pre-processor just finished working on new image
         """
         DYNAMIC_DATA.pre_processor_busy = False
+        Controller._wake_waiting_scanners()
         self._notify_model_observers()
 
-    @log
     def on_stacker_busy(self):
         """
         stacker just started working on new image
@@ -390,15 +486,14 @@ class Controller:
         DYNAMIC_DATA.stacker_busy = True
         self._notify_model_observers()
 
-    @log
     def on_stacker_waiting(self):
         """
         stacker just finished working on new image
         """
         DYNAMIC_DATA.stacker_busy = False
+        Controller._wake_waiting_scanners()
         self._notify_model_observers()
 
-    @log
     def on_post_processor_busy(self):
         """
         post-processor just started working on new image
@@ -406,7 +501,6 @@ class Controller:
         DYNAMIC_DATA.post_processor_busy = True
         self._notify_model_observers()
 
-    @log
     def on_post_processor_waiting(self):
         """
         post-processor just finished working on new image
@@ -414,7 +508,6 @@ class Controller:
         DYNAMIC_DATA.post_processor_busy = False
         self._notify_model_observers()
 
-    @log
     def on_saver_busy(self):
         """
         saver just started working on new image
@@ -422,7 +515,6 @@ class Controller:
         DYNAMIC_DATA.saver_busy = True
         self._notify_model_observers()
 
-    @log
     def on_saver_waiting(self):
         """
         saver just finished working on new image
@@ -492,6 +584,7 @@ class Controller:
         """
         if not DYNAMIC_DATA.session.is_stopped:
             DYNAMIC_DATA.session.set_status(Session.stopped)
+            Controller._wake_waiting_scanners()
             self._stop_input_scanner()
             Controller.purge_queue(self._pre_process_queue)
             Controller.purge_queue(self._stacker_queue)
@@ -554,36 +647,92 @@ class Controller:
         :param queue: the queue to purge
         :type queue: SignalingQueue
         """
-
-        while not queue.empty():
-            queue.get()
+        queue.clear()
 
     @staticmethod
     @log
     def _setup_web_content():
         """Prepares the work folder."""
+        global _INDEX_TEMPLATE  # pylint: disable=global-statement
 
         web_folder_path = config.get_web_folder_path()
 
-        index_content = get_text_content_of_resource(":/web/index.html")
-        index_content = index_content.replace('##PERIOD##', str(config.get_www_server_refresh_period()))
+        if _INDEX_TEMPLATE is None:
+            _INDEX_TEMPLATE = get_text_content_of_resource(":/web/index.html")
 
-        with open(web_folder_path + "/index.html", 'w') as index_file:
-            index_file.write(index_content)
+        index_content = _INDEX_TEMPLATE.replace('##PERIOD##', str(config.get_www_server_refresh_period()))
+        index_path = Path(web_folder_path) / "index.html"
 
+        if not index_path.is_file() or index_path.read_text() != index_content:
+            index_path.write_text(index_content)
+
+        # the standby image is the very file the image saver overwrites in place once results
+        # flow : hardlinking it would expose the cached inode to those writes, so it is copied
         standby_image_path = Path(web_folder_path) / (WEB_SERVED_IMAGE_FILE_NAME_BASE + '.' + IMAGE_SAVE_TYPE_JPEG)
-        standby_file = QFile(":/web/waiting.jpg")
-        if standby_image_path.is_file():
-            standby_image_path.unlink()
-        standby_file.copy(str(standby_image_path.resolve()))
-        standby_image_path.chmod(0o644)
+        Controller._install_static_asset(":/web/waiting.jpg", standby_image_path, allow_link=False)
 
         favicon_image_path = Path(web_folder_path) / "favicon.ico"
-        standby_file = QFile(":/icons/als_logo.ico")
-        if favicon_image_path.is_file():
-            favicon_image_path.unlink()
-        standby_file.copy(str(favicon_image_path.resolve()))
-        favicon_image_path.chmod(0o644)
+        Controller._install_static_asset(":/icons/als_logo.ico", favicon_image_path)
+
+    @staticmethod
+    @log
+    def _install_static_asset(resource_uri: str, destination_path: Path, allow_link: bool = True):
+        """
+        Installs a Qt resource as a destination file, skipping all work when the destination
+        already holds the resource content.
+
+        Sessions are started and resumed many times : re-copying identical assets on each start
+        only costs disk writes. Resource bytes are cached on first use, so subsequent starts pay
+        a read and compare at most.
+
+        When the destination must be (re)created, the asset is extracted once to an on-disk
+        cache and hardlinked into place : the web server then serves the cached inode without
+        any content copy. A plain byte copy is the fallback when linking is not possible
+        (cross-filesystem destination, platform without hardlinks), and the only mode used
+        when allow_link is False : destinations the application later overwrites in place
+        must never share the cache's inode.
+
+        :param resource_uri: URI of the resource to install
+        :type resource_uri: str
+
+        :param destination_path: path of the file to install the resource to
+        :type destination_path: pathlib.Path
+
+        :param allow_link: may the destination be hardlinked to the on-disk cache ?
+        :type allow_link: bool
+        """
+        if resource_uri not in _STATIC_ASSET_BYTES_CACHE:
+            _STATIC_ASSET_BYTES_CACHE[resource_uri] = get_binary_content_of_resource(resource_uri)
+
+        asset_bytes = _STATIC_ASSET_BYTES_CACHE[resource_uri]
+
+        if destination_path.is_file() and \
+                destination_path.stat().st_size == len(asset_bytes) and \
+                destination_path.read_bytes() == asset_bytes:
+            return
+
+        if destination_path.is_file():
+            destination_path.unlink()
+
+        if allow_link:
+            try:
+                cache_path = _STATIC_ASSET_CACHE_DIR / resource_uri.split('/')[-1]
+
+                # cache content is verified, not trusted : a cached asset damaged on disk
+                # would otherwise poison every later install
+                if not cache_path.is_file() or cache_path.read_bytes() != asset_bytes:
+                    _STATIC_ASSET_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                    cache_path.write_bytes(asset_bytes)
+
+                os.link(str(cache_path), str(destination_path))
+
+            except OSError:
+                destination_path.write_bytes(asset_bytes)
+
+        else:
+            destination_path.write_bytes(asset_bytes)
+
+        destination_path.chmod(0o644)
 
     @log
     def save_post_process_result(self, final=False):
@@ -635,15 +784,56 @@ class Controller:
         :param add_timestamp: Do we add a timestamp to image name
         :type add_timestamp: bool
         """
-        filename_base = filename_base
-
         if add_timestamp:
-            filename_base += '-' + get_timestamp().replace(' ', "-").replace(":", '-').replace('.', '-')
+            filename_base += '-' + get_timestamp_for_filename()
+
+        # destination is computed before cloning : the clone is a full pixel array copy, and it
+        # stays mandatory as the saver mutates and releases the images it consumes
+        destination = f"{dest_folder_path}/{filename_base}.{file_extension}"
+
+        # JPEG encodes can be routed to the process pool. Data is copied synchronously at
+        # submit time : the image's buffer may return to the pool when the next result
+        # replaces it, before the executor is done pickling
+        if self._saver_executor is not None and file_extension == IMAGE_SAVE_TYPE_JPEG:
+            future = self._saver_executor.submit(
+                encode_and_write_jpeg, image.data.copy(), image.is_color(), destination)
+            future.add_done_callback(partial(Controller._on_pooled_save_done, destination))
+            return
 
         image_to_save = image.clone()
-        image_to_save.destination = dest_folder_path + "/" + filename_base + '.' + file_extension
+        image_to_save.destination = destination
         self._saver_queue.put(image_to_save)
 
+    @staticmethod
+    def _on_pooled_save_done(destination: str, future):
+        """
+        Reports the outcome of a JPEG save performed on the saver process pool.
+
+        Runs on an executor callback thread : messages are dispatched through the hub, which
+        relays them to the Qt main thread.
+
+        :param destination: the path the save targeted
+        :type destination: str
+
+        :param future: the completed save future
+        """
+        try:
+            save_is_successful = future.result()
+            failure_details = ""
+        except Exception as error:  # pylint: disable=broad-except
+            save_is_successful = False
+            failure_details = str(error)
+
+        if save_is_successful:
+            MESSAGE_HUB.dispatch_info(__name__, QT_TRANSLATE_NOOP("", "Image saved : {}"), [destination, ])
+        else:
+            details = destination
+
+            if failure_details.strip():
+                details += ' : ' + failure_details
+
+            MESSAGE_HUB.dispatch_error(__name__, QT_TRANSLATE_NOOP("", "Failed to save image : {}"), [details, ])
+
     @log
     def shutdown(self):
         """
@@ -662,6 +852,9 @@ class Controller:
         self._saver.stop()
         self._saver.wait()
 
+        if self._saver_executor is not None:
+            self._saver_executor.shutdown(wait=True)
+
     @log
     def _stop_input_scanner(self):
         self._input_scanner.stop()
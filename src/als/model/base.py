@@ -2,6 +2,8 @@
 Provide base application data types
 """
 import logging
+import threading
+import weakref
 
 from PyQt5.QtCore import pyqtSignal, QObject
 import numpy as np
@@ -11,6 +13,109 @@ from als.code_utilities import log
 _LOGGER = logging.getLogger(__name__)
 
 
+class ImageBufferPool:
+    """
+    Keeps a small set of reusable pixel buffers, keyed on (shape, dtype).
+
+    Frames of a session all share the same shape and dtype : recycling pixel buffers avoids a
+    multi-MB allocation (and the matching page-fault storm) every time an image is decoded or
+    cloned on the pipeline hot path.
+
+    Buffers handed out by :meth:`acquire` are tracked in a weak identity map, so :meth:`release`
+    silently ignores arrays that did not come from the pool. This keeps release call sites
+    simple : they may hand back whatever array they are discarding. The map is weak on purpose :
+    a lent buffer dropped without release just leaves the pool when garbage collected, and a
+    dead buffer's recycled object id can never be mistaken for a live lent one.
+
+    Views of a lent buffer (dtype reinterpretations, axis moves...) may be released in its
+    place : ownership is resolved by walking the view chain back to the lent base array.
+    """
+
+    @log
+    def __init__(self, max_buffers_per_key: int = 8):
+        self._free_buffers = dict()
+        self._lent_buffers = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+        self._max_buffers_per_key = max_buffers_per_key
+
+    def acquire(self, shape, dtype):
+        """
+        Gets a buffer of requested shape and dtype, reusing a pooled one if possible.
+
+        Buffer content is undefined : callers are expected to overwrite it entirely.
+
+        :param shape: the requested buffer shape
+        :param dtype: the requested buffer dtype
+
+        :return: an ndarray of requested shape and dtype
+        :rtype: numpy.ndarray
+        """
+        key = (tuple(shape), np.dtype(dtype).str)
+
+        with self._lock:
+            free_buffers = self._free_buffers.get(key)
+            buffer = free_buffers.pop() if free_buffers else np.empty(shape, dtype)
+            self._lent_buffers[id(buffer)] = buffer
+
+        return buffer
+
+    def release(self, buffer):
+        """
+        Hands a buffer back to the pool.
+
+        Arrays that were not lent by this pool, and views of such arrays, are ignored. Views of
+        a lent buffer release their base array, with its original shape and dtype.
+
+        :param buffer: the buffer to recycle
+        :type buffer: numpy.ndarray
+        """
+        if not isinstance(buffer, np.ndarray):
+            return
+
+        with self._lock:
+
+            lent_buffer = self._resolve_lent_buffer(buffer)
+
+            if lent_buffer is None:
+                return
+
+            del self._lent_buffers[id(lent_buffer)]
+            key = (lent_buffer.shape, lent_buffer.dtype.str)
+            free_buffers = self._free_buffers.setdefault(key, list())
+
+            if len(free_buffers) < self._max_buffers_per_key:
+                free_buffers.append(lent_buffer)
+
+    def _resolve_lent_buffer(self, buffer):
+        """
+        Finds the lent array a released array stands for, if any.
+
+        The released array's view chain is walked back to its base : each candidate is only
+        accepted on object identity with the live entry of the lent map, so a foreign array
+        can never be adopted. Must be called under the pool lock.
+
+        :param buffer: the array being released
+        :type buffer: numpy.ndarray
+
+        :return: the lent array to take back, or None if buffer does not stand for any
+        :rtype: numpy.ndarray or None
+        """
+        candidate = buffer
+
+        while candidate is not None:
+
+            if self._lent_buffers.get(id(candidate)) is candidate:
+                return candidate
+
+            candidate = candidate.base if isinstance(candidate.base, np.ndarray) else None
+
+        return None
+
+
+IMAGE_BUFFER_POOL = ImageBufferPool()
+"""Application-wide pixel buffer pool, shared by image readers and Image.clone()"""
+
+
 class Session(QObject):
     """
     Represents an ALS session
@@ -96,24 +201,65 @@ class Image:
         :type data: numpy.ndarray
         """
         self._data = data
+        self._data_is_shared = False
         self._bayer_pattern: str = ""
         self._origin: str = "UNDEFINED"
         self._destination: str = "UNDEFINED"
+        self._histogram = None
 
     @log
     def clone(self):
         """
         Clone an image
 
+        Cloned data lives in a buffer drawn from the application-wide pool : call :meth:`release`
+        on the clone once it is no longer used, so its buffer can be reused
+
         :return: an image with global copied data
         :rtype: Image
         """
-        new = Image(self.data.copy())
+        new_data = IMAGE_BUFFER_POOL.acquire(self.data.shape, self.data.dtype)
+        np.copyto(new_data, self.data)
+        new = Image(new_data)
         new.bayer_pattern = self.bayer_pattern
         new.origin = self.origin
         new.destination = self.destination
+        new.histogram = self.histogram
         return new
 
+    @log
+    def shallow_clone(self):
+        """
+        Clone an image without copying its pixel data
+
+        The returned image shares this image's data array and is flagged accordingly : rebinding
+        its data, releasing it, or running it through the processing helpers will never hand the
+        shared array back to the buffer pool. Receivers must still rebind data to a new array
+        before any mutation
+
+        :return: an image sharing this image's data
+        :rtype: Image
+        """
+        new = Image(self._data)
+        new.data_is_shared = True
+        new.bayer_pattern = self.bayer_pattern
+        new.origin = self.origin
+        new.destination = self.destination
+        new.histogram = self.histogram
+        return new
+
+    @log
+    def release(self):
+        """
+        Hands this image's pixel buffer back to the application-wide pool.
+
+        The image must not be used afterwards. Buffers that did not come from the pool are
+        simply dropped, and a shared data array is left alone : its owner will recycle it
+        """
+        if not self._data_is_shared:
+            IMAGE_BUFFER_POOL.release(self._data)
+        self._data = None
+
     @property
     def destination(self):
         """
@@ -147,6 +293,44 @@ class Image:
     @data.setter
     def data(self, data):
         self._data = data
+        self._data_is_shared = False
+
+    @property
+    def data_is_shared(self):
+        """
+        Is this image's data array shared with another image ?
+
+        A shared array belongs to its original owner and must never be handed back to the
+        buffer pool through this image
+
+        :return: True if data is shared, False otherwise
+        :rtype: bool
+        """
+        return self._data_is_shared
+
+    @data_is_shared.setter
+    def data_is_shared(self, data_is_shared):
+        self._data_is_shared = data_is_shared
+
+    @property
+    def histogram(self):
+        """
+        Retrieves the display histograms computed for this image, if any
+
+        :return: the histograms or None
+        :rtype: als.model.data.HistogramContainer or None
+        """
+        return self._histogram
+
+    @histogram.setter
+    def histogram(self, histogram):
+        """
+        Sets the display histograms computed for this image
+
+        :param histogram: the histograms
+        :type histogram: als.model.data.HistogramContainer
+        """
+        self._histogram = histogram
 
     @property
     def origin(self):
@@ -2,6 +2,7 @@
 Provides base application data
 """
 import logging
+import threading
 from typing import List
 
 import numpy as np
@@ -123,6 +124,7 @@ class DynamicData:
         self.saver_busy = False
         self.has_new_warnings = False
         self.is_first_run = True
+        self.workers_idle_condition = threading.Condition()
 
 
 class HistogramContainer:
@@ -8,13 +8,15 @@ from pathlib import Path
 
 import cv2
 import numpy as np
+from numba import njit, prange
 from PyQt5.QtCore import QThread, pyqtSignal, QT_TRANSLATE_NOOP
 from scipy.signal import convolve2d
 from skimage import exposure
 
 from als.code_utilities import log, Timer, SignalingQueue, human_readable_byte_size
+from als.crunching import compute_histograms_for_display
 from als.messaging import MESSAGE_HUB
-from als.model.base import Image
+from als.model.base import Image, IMAGE_BUFFER_POOL
 from als.model.data import I18n, DYNAMIC_DATA
 from als.model.params import ProcessingParameter, RangeParameter, SwitchParameter, ListParameter
 from als.io import input as als_input
@@ -32,6 +34,28 @@ class ProcessingError(Exception):
     """
 
 
+def _replace_image_data(image: Image, new_data):
+    """
+    Rebinds an image's data array and recycles the discarded one.
+
+    If the old array was lent by the input buffer pool, it becomes available again for the
+    next decoded frame. An array the image does not own, i.e. shared through
+    :meth:`Image.shallow_clone`, is left alone : recycling it would hand the stacker's live
+    data to the pool.
+
+    :param image: the image to update
+    :type image: Image
+
+    :param new_data: the new data array
+    :type new_data: numpy.ndarray
+    """
+    old_data = image.data
+    old_data_was_shared = image.data_is_shared
+    image.data = new_data
+    if new_data is not old_data and not old_data_was_shared:
+        als_input.recycle(old_data)
+
+
 # pylint: disable=R0903
 class ImageProcessor:
     """
@@ -322,6 +346,190 @@ class Levels(ImageProcessor):
         return image
 
 
+@njit(parallel=True)
+def _apply_color_lut(data, lut, index_scale, out):
+    """
+    Applies a per-channel lookup table to a color image in one parallel pass.
+
+    data and out are float32 arrays of shape (3, height, width), lut is a float32 array of
+    shape (3, 65536). Pixel values are multiplied by index_scale to land in the table domain
+    (1.0 when data already fits in 16 bits), then clamped to table bounds before indexing.
+    """
+    height = data.shape[1]
+    width = data.shape[2]
+
+    for row in prange(height):  # pylint: disable=not-an-iterable
+        for channel in range(3):
+            for col in range(width):
+                index = int(data[channel, row, col] * index_scale)
+                if index < 0:
+                    index = 0
+                elif index > _16_BITS_MAX_VALUE:
+                    index = _16_BITS_MAX_VALUE
+                out[channel, row, col] = lut[channel, index]
+
+
+@njit(parallel=True)
+def _apply_mono_lut(data, lut, index_scale, out):
+    """
+    Applies a lookup table to a b&w image in one parallel pass.
+
+    data and out are float32 arrays of shape (height, width), lut is a float32 array of
+    65536 entries. Pixel values are multiplied by index_scale to land in the table domain
+    (1.0 when data already fits in 16 bits), then clamped to table bounds before indexing.
+    """
+    height = data.shape[0]
+    width = data.shape[1]
+
+    for row in prange(height):  # pylint: disable=not-an-iterable
+        for col in range(width):
+            index = int(data[row, col] * index_scale)
+            if index < 0:
+                index = 0
+            elif index > _16_BITS_MAX_VALUE:
+                index = _16_BITS_MAX_VALUE
+            out[row, col] = lut[index]
+
+
+class FusedTonePipeline(ImageProcessor):
+    """
+    Fuses autostretch, levels and color balance into a single pass over the image.
+
+    Autostretch runs unchanged first, as it depends on the image's own statistics. The remaining
+    adjustments (midtones gamma, black / white levels, final rescale and color gains) are all
+    monotonic per-pixel point functions : they are composed into a lookup table of 65536 entries
+    per channel, applied by a compiled parallel kernel. The image is then read and written once,
+    instead of once per adjustment.
+
+    The table is rebuilt only when a parameter or the image's data range changes ; table lookups
+    quantize pixel values to table entries, i.e. at most one 16 bits count.
+
+    Parameter sets remain owned by the wrapped processors, so UI code keeps talking to them.
+    """
+
+    @log
+    def __init__(self, autostretch: AutoStretch, levels: Levels, color_balance: ColorBalance):
+        super().__init__()
+        self._autostretch = autostretch
+        self._levels = levels
+        self._color_balance = color_balance
+        self._lut = None
+        self._lut_signature = None
+
+    @log
+    def process_image(self, image: Image):
+
+        image = self._autostretch.process_image(image)
+
+        data_min = float(image.data.min())
+        data_max = float(image.data.max())
+
+        # data wider than 16 bits (e.g. a SUM stack with autostretch off) is mapped onto the
+        # table domain by a per-frame index scale : clamping instead would crush every value
+        # above the table to white. Table entry i then stands for pixel value i / index_scale
+        index_scale = _16_BITS_MAX_VALUE / data_max if data_max > _16_BITS_MAX_VALUE else 1.0
+
+        # levels' final rescale is anchored on the image's actual data range : it is part of
+        # the table signature, so a range change triggers a table rebuild
+        min_index = min(max(int(data_min * index_scale), 0), _16_BITS_MAX_VALUE)
+        max_index = min(max(int(data_max * index_scale), 0), _16_BITS_MAX_VALUE)
+
+        signature = (
+            tuple(param.value for param in self._levels.get_parameters()),
+            tuple(param.value for param in self._color_balance.get_parameters()),
+            image.is_color(),
+            min_index,
+            max_index,
+            index_scale)
+
+        if signature != self._lut_signature:
+            self._lut = self._build_lut(image.is_color(), min_index, max_index, index_scale)
+            self._lut_signature = signature
+
+        if self._lut is None:
+            return image
+
+        out = IMAGE_BUFFER_POOL.acquire(image.data.shape, np.float32)
+
+        if image.is_color():
+            _apply_color_lut(image.data, self._lut, np.float32(index_scale), out)
+        else:
+            _apply_mono_lut(image.data, self._lut, np.float32(index_scale), out)
+
+        _replace_image_data(image, out)
+
+        return image
+
+    @log
+    def _build_lut(self, is_color: bool, min_index: int, max_index: int, index_scale: float):
+        """
+        Composes levels and color balance adjustments into a lookup table.
+
+        :param is_color: is the image to process a color image ?
+        :type is_color: bool
+
+        :param min_index: table index of the image's lowest pixel value
+        :type min_index: int
+
+        :param max_index: table index of the image's highest pixel value
+        :type max_index: int
+
+        :param index_scale: factor mapping pixel values to table indices : entry i stands for
+                            pixel value i / index_scale. 1.0 for data fitting in 16 bits
+        :type index_scale: float
+
+        :return: a (3, 65536) float32 table for color images, a 65536 entries float32 table
+                 for b&w ones, or None if all adjustments are no-ops
+        """
+        levels_active, black, midtones, white = self._levels.get_parameters()
+        rgb_active, red, green, blue = self._color_balance.get_parameters()
+
+        gains_are_noop = not rgb_active.value or not is_color or \
+            (red.is_default() and green.is_default() and blue.is_default())
+
+        if not levels_active.value and gains_are_noop:
+            return None
+
+        # adjustments are computed on the pixel values each entry stands for, so gamma and
+        # black / white levels keep their 16 bits units whatever the data range
+        curve = np.arange(_16_BITS_MAX_VALUE + 1, dtype=np.float32)
+
+        if index_scale != 1.0:
+            curve /= np.float32(index_scale)
+
+        if levels_active.value:
+
+            if not midtones.is_default():
+                midtones_value = midtones.value if midtones.value > 0 else 0.1
+                curve = _16_BITS_MAX_VALUE * curve ** (1 / midtones_value) / _16_BITS_MAX_VALUE ** (
+                    1 / midtones_value)
+
+            if not black.is_default() or not white.is_default():
+                curve = np.clip(curve, black.value, white.value)
+
+            low, high = curve[min_index], curve[max_index]
+
+            if high > low:
+                curve = np.interp(curve, (low, high), (0, _16_BITS_MAX_VALUE))
+
+        curve = np.float32(curve)
+
+        if not is_color:
+            return curve
+
+        lut = np.empty((3, _16_BITS_MAX_VALUE + 1), dtype=np.float32)
+
+        if gains_are_noop:
+            for channel in range(3):
+                lut[channel] = curve
+        else:
+            for channel, param in enumerate((red, green, blue)):
+                gain = (param.value if param.value > 0 else 0.1) if not param.is_default() else 1
+                lut[channel] = np.clip(curve * gain, 0, _16_BITS_MAX_VALUE)
+
+        return lut
+
+
 # pylint: disable=R0903
 class Standardize(ImageProcessor):
     """
@@ -341,7 +549,7 @@ class Standardize(ImageProcessor):
         if image.is_color():
             image.set_color_axis_as(0)
 
-        image.data = np.float32(image.data)
+        _replace_image_data(image, np.float32(image.data))
 
         return image
 
@@ -383,7 +591,7 @@ class HotPixelRemover(ImageProcessor):
 
             if not image.is_color():
                 means = HotPixelRemover._neighbors_average(image.data)
-                image.data = np.where(image.data / means > _HOT_PIXEL_RATIO, means, image.data)
+                _replace_image_data(image, np.where(image.data / means > _HOT_PIXEL_RATIO, means, image.data))
             else:
                 MESSAGE_HUB.dispatch_warning(
                     __name__,
@@ -440,7 +648,7 @@ class Debayer(ImageProcessor):
         except cv2.error as error:
             raise ProcessingError(f"Debayering error : {str(error)}")
 
-        image.data = debayered_data
+        _replace_image_data(image, debayered_data)
 
         return image
 
@@ -459,62 +667,91 @@ class RemoveDark(ImageProcessor):
 
         if do_subtract:
 
-            dark = als_input.read_disk_image(Path(config.get_master_dark_file_path()))
+            dark_data = RemoveDark.get_conformed_dark_data(image)
 
-            if dark is None:
-                read_error_message = QT_TRANSLATE_NOOP(
-                    "",
-                    "Could not read dark {}. Dark subtraction is SKIPPED"
-                )
-                read_error_values = [config.get_master_dark_file_path(), ]
-                MESSAGE_HUB.dispatch_warning(__name__, read_error_message, read_error_values)
+            if dark_data is None:
                 return image
 
-            if not image.is_same_shape_as(dark):
-                mismatch_message = QT_TRANSLATE_NOOP(
-                    "",
-                    "Data structure inconsistency. Light: {} vs Dark: {}. Dark subtraction is SKIPPED"
-                )
-                mismatch_values = [image.data.shape, dark.data.shape]
-                MESSAGE_HUB.dispatch_warning(__name__, mismatch_message, mismatch_values)
-                return image
+            _LOGGER.debug("Subtracting dark frame...")
 
-            if image.data.dtype.name != dark.data.dtype.name:
+            with Timer() as subtraction_timer:
+                _replace_image_data(image, np.where(image.data > dark_data, image.data - dark_data, 0))
+            _LOGGER.debug(f"Dark frame subtracted in {subtraction_timer.elapsed_in_milli_as_str} ms")
 
-                MESSAGE_HUB.dispatch_warning(
-                    __name__,
-                    QT_TRANSLATE_NOOP(
-                        "",
-                        "Dark & Light data types mismatch. Light: {} vs Dark: {}. Dark needs to be conformed."
-                    ),
-                    [image.data.dtype.name, dark.data.dtype.name])
+            # the dark is re-read for each frame : its decode buffer goes straight back to the pool
+            IMAGE_BUFFER_POOL.release(dark_data)
 
-                with Timer() as conforming_timer:
+        return image
 
-                    try:
-                        image_min_allowed, image_max_allowed = RemoveDark._get_allowed_min_and_max(image.data)
-                    except TypeError:
-                        raise ProcessingError(f"unhandled image data type : {image.data.dtype.type}")
+    @staticmethod
+    @log
+    def get_conformed_dark_data(image: Image):
+        """
+        Reads the master dark and conforms it to an image's shape and data type.
 
-                    try:
-                        dark_min_allowed, dark_max_allowed = RemoveDark._get_allowed_min_and_max(dark.data)
-                    except TypeError:
-                        raise ProcessingError(f"unhandled masterdark data type : {dark.data.dtype.type}")
+        Problems that prevent subtraction (unreadable dark, shape mismatch) are reported as
+        warnings, and None is returned : callers then skip subtraction for this image.
 
-                    dark.data = np.interp(
-                        dark.data,
-                        (dark_min_allowed, dark_max_allowed),
-                        (image_min_allowed, image_max_allowed)).astype(image.data.dtype)
+        :param image: the image the dark will be subtracted from
+        :type image: Image
 
-                _LOGGER.debug(f"Dark frame conforming done in {conforming_timer.elapsed_in_milli_as_str} ms")
+        :return: the conformed dark data, or None if subtraction must be skipped
+        :rtype: numpy.ndarray or None
+        """
+        dark = als_input.read_disk_image(Path(config.get_master_dark_file_path()))
 
-            _LOGGER.debug("Subtracting dark frame...")
+        if dark is None:
+            read_error_message = QT_TRANSLATE_NOOP(
+                "",
+                "Could not read dark {}. Dark subtraction is SKIPPED"
+            )
+            read_error_values = [config.get_master_dark_file_path(), ]
+            MESSAGE_HUB.dispatch_warning(__name__, read_error_message, read_error_values)
+            return None
+
+        if not image.is_same_shape_as(dark):
+            mismatch_message = QT_TRANSLATE_NOOP(
+                "",
+                "Data structure inconsistency. Light: {} vs Dark: {}. Dark subtraction is SKIPPED"
+            )
+            mismatch_values = [image.data.shape, dark.data.shape]
+            MESSAGE_HUB.dispatch_warning(__name__, mismatch_message, mismatch_values)
+            return None
 
-            with Timer() as subtraction_timer:
-                image.data = np.where(image.data > dark.data, image.data - dark.data, 0)
-            _LOGGER.debug(f"Dark frame subtracted in {subtraction_timer.elapsed_in_milli_as_str} ms")
+        if image.data.dtype.name != dark.data.dtype.name:
 
-        return image
+            MESSAGE_HUB.dispatch_warning(
+                __name__,
+                QT_TRANSLATE_NOOP(
+                    "",
+                    "Dark & Light data types mismatch. Light: {} vs Dark: {}. Dark needs to be conformed."
+                ),
+                [image.data.dtype.name, dark.data.dtype.name])
+
+            with Timer() as conforming_timer:
+
+                try:
+                    image_min_allowed, image_max_allowed = RemoveDark._get_allowed_min_and_max(image.data)
+                except TypeError:
+                    raise ProcessingError(f"unhandled image data type : {image.data.dtype.type}")
+
+                try:
+                    dark_min_allowed, dark_max_allowed = RemoveDark._get_allowed_min_and_max(dark.data)
+                except TypeError:
+                    raise ProcessingError(f"unhandled masterdark data type : {dark.data.dtype.type}")
+
+                original_dark_data = dark.data
+                dark.data = np.interp(
+                    dark.data,
+                    (dark_min_allowed, dark_max_allowed),
+                    (image_min_allowed, image_max_allowed)).astype(image.data.dtype)
+
+                # conforming rebinds away from the decode buffer : recycle it
+                IMAGE_BUFFER_POOL.release(original_dark_data)
+
+            _LOGGER.debug(f"Dark frame conforming done in {conforming_timer.elapsed_in_milli_as_str} ms")
+
+        return dark.data
 
     @staticmethod
     def _get_allowed_min_and_max(data):
@@ -539,17 +776,206 @@ class RemoveDark(ImageProcessor):
         return allowed_min, allowed_max
 
 
+@njit(parallel=True)
+def _subtract_dark_and_clamp_hot_pixels(light, dark, out, do_subtract, do_hot_pixels, hot_pixel_ratio):
+    """
+    Fuses dark subtraction and hot pixel clamping into one parallel sweep over a raw frame.
+
+    light, dark and out are 2D arrays of identical shape and dtype. For each pixel, the dark
+    value is saturating-subtracted, then the pixel is compared to the mean of its dark-subtracted
+    in-bounds neighbors and clamped to that mean when it exceeds it by more than
+    hot_pixel_ratio. Neighbor values are recomputed on the fly : they stay in registers instead
+    of round-tripping through full-image intermediates.
+
+    When do_subtract is False, dark is ignored (callers pass any same-shaped array).
+    """
+    height = light.shape[0]
+    width = light.shape[1]
+
+    for row in prange(height):  # pylint: disable=not-an-iterable
+        for col in range(width):
+
+            if do_subtract:
+                value = float(light[row, col]) - float(dark[row, col])
+                if value < 0:
+                    value = 0.0
+            else:
+                value = float(light[row, col])
+
+            if do_hot_pixels:
+                total = 0.0
+                count = 0
+
+                for neighbor_row in range(max(0, row - 1), min(height, row + 2)):
+                    for neighbor_col in range(max(0, col - 1), min(width, col + 2)):
+
+                        if neighbor_row == row and neighbor_col == col:
+                            continue
+
+                        if do_subtract:
+                            neighbor_value = float(light[neighbor_row, neighbor_col]) - \
+                                float(dark[neighbor_row, neighbor_col])
+                            if neighbor_value < 0:
+                                neighbor_value = 0.0
+                        else:
+                            neighbor_value = float(light[neighbor_row, neighbor_col])
+
+                        total += neighbor_value
+                        count += 1
+
+                mean = total / count
+
+                if value > hot_pixel_ratio * mean:
+                    value = mean
+
+            out[row, col] = value
+
+
+class FusedPreProcess(ImageProcessor):
+    """
+    Fuses dark subtraction and hot pixel removal into a single compiled sweep over raw frames.
+
+    Run sequentially, those stages each read and write the full frame, and the hot pixel
+    remover's two scipy convolutions alone cost several full-image passes. The fused kernel
+    reads the raw frame once and writes the cleaned frame once.
+
+    Debayering stays a separate stage on purpose : cv2's SIMD demosaicing outperforms anything
+    we would hand-roll, and it runs on the already-cleaned frame.
+
+    Color (already debayered) images cannot go through the 2D kernel and fall back to the
+    sequential processors, keeping their warnings and behavior unchanged.
+    """
+
+    @log
+    def __init__(self):
+        super().__init__()
+        self._remove_dark = RemoveDark()
+        self._hot_pixel_remover = HotPixelRemover()
+
+    @log
+    def process_image(self, image: Image):
+
+        if image.is_color():
+            image = self._remove_dark.process_image(image)
+            return self._hot_pixel_remover.process_image(image)
+
+        do_subtract = config.get_use_master_dark()
+        do_hot_pixels = config.get_hot_pixel_remover()
+
+        dark_data = None
+
+        if do_subtract:
+            dark_data = RemoveDark.get_conformed_dark_data(image)
+            do_subtract = dark_data is not None
+
+        if not do_subtract and not do_hot_pixels:
+            return image
+
+        out = IMAGE_BUFFER_POOL.acquire(image.data.shape, image.data.dtype)
+
+        _subtract_dark_and_clamp_hot_pixels(
+            image.data,
+            dark_data if dark_data is not None else image.data,
+            out,
+            do_subtract,
+            do_hot_pixels,
+            _HOT_PIXEL_RATIO)
+
+        _replace_image_data(image, out)
+
+        if dark_data is not None:
+            IMAGE_BUFFER_POOL.release(dark_data)
+
+        return image
+
+
+@njit(parallel=True)
+def _saturate_cast_color_to_uint16(data, out):
+    """
+    Clips a color image to the unsigned 16 bits range and casts it, in one parallel pass.
+
+    data is a float array of shape (3, height, width), out a uint16 array of the same shape.
+    """
+    height = data.shape[1]
+    width = data.shape[2]
+
+    for row in prange(height):  # pylint: disable=not-an-iterable
+        for channel in range(3):
+            for col in range(width):
+                value = data[channel, row, col]
+                if value < 0:
+                    value = 0
+                elif value > _16_BITS_MAX_VALUE:
+                    value = _16_BITS_MAX_VALUE
+                out[channel, row, col] = np.uint16(value)
+
+
+@njit(parallel=True)
+def _saturate_cast_mono_to_uint16(data, out):
+    """
+    Clips a b&w image to the unsigned 16 bits range and casts it, in one parallel pass.
+
+    data is a float array of shape (height, width), out a uint16 array of the same shape.
+    """
+    height = data.shape[0]
+    width = data.shape[1]
+
+    for row in prange(height):  # pylint: disable=not-an-iterable
+        for col in range(width):
+            value = data[row, col]
+            if value < 0:
+                value = 0
+            elif value > _16_BITS_MAX_VALUE:
+                value = _16_BITS_MAX_VALUE
+            out[row, col] = np.uint16(value)
+
+
 class ConvertForOutput(ImageProcessor):
     """
     Moves colors data to 3rd array axis for color images and reduce data range to unsigned 16 bits
+
+    Clip and cast are fused in a single compiled pass writing into a pooled buffer : the NumPy
+    equivalent np.uint16(np.clip(...)) materializes a full clipped float temporary first. The
+    cast runs before the color axis move, which is a pure metadata operation.
     """
     @log
     def process_image(self, image: Image):
 
+        out = IMAGE_BUFFER_POOL.acquire(image.data.shape, np.uint16)
+
+        if image.is_color():
+            _saturate_cast_color_to_uint16(image.data, out)
+        else:
+            _saturate_cast_mono_to_uint16(image.data, out)
+
+        _replace_image_data(image, out)
+
         if image.is_color():
             image.set_color_axis_as(2)
 
-        image.data = np.uint16(np.clip(image.data, 0, 2 ** 16 - 1))
+        return image
+
+
+class ComputeHistograms(ImageProcessor):
+    """
+    Computes display histograms and attaches them to the image.
+
+    Meant to run as the last step of the post-process pipeline, inside its worker thread : the
+    Qt main thread then receives images whose histograms are already computed and only has to
+    publish them.
+    """
+
+    @log
+    def __init__(self, bin_count: int):
+        super().__init__()
+        self._bin_count = bin_count
+
+    @log
+    def process_image(self, image: Image):
+
+        # each frame's histograms are freshly allocated : the main thread publishes them at its
+        # own pace and may still read an older frame's counts while we compute the next ones
+        image.histogram = compute_histograms_for_display(image, self._bin_count)
 
         return image
 
@@ -644,7 +1070,10 @@ class Pipeline(QueueConsumer):
 
             self.new_result_signal.emit(image)
 
-        except ProcessingError as processing_error:
+        # any escaping exception, not just ProcessingError, must drop the frame rather than
+        # kill the pipeline thread : a compiled kernel rejecting an unexpected dtype would
+        # otherwise silently stop all processing for the rest of the session
+        except Exception as processing_error:  # pylint: disable=broad-except
             message = QT_TRANSLATE_NOOP("", "Error applying process '{}' to image {} : {} *** Image will be ignored")
             MESSAGE_HUB.dispatch_warning(__name__, message, [processor.__class__.__name__, image, processing_error])
 